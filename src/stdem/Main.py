@@ -1,8 +1,10 @@
 import argparse
-import glob
 import os
 import sys
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Optional, Tuple
 from pathlib import Path
 from importlib.metadata import version, PackageNotFoundError
 
@@ -19,6 +21,17 @@ except PackageNotFoundError:
     __version__ = "unknown"
 
 
+def positive_int(value: str) -> int:
+    """Argument type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point for the stdem CLI"""
     parser = argparse.ArgumentParser(
@@ -68,6 +81,14 @@ def main():
         action="store_true",
         help="Don't clear output directory before conversion",
     )
+    convert_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        metavar="N",
+        help="Number of files converted in parallel (default: CPU count)",
+    )
     convert_parser.add_argument(
         "-q", "--quiet", action="store_true", help="Suppress output (only show errors)"
     )
@@ -135,6 +156,7 @@ def convert_command(args):
                 indent=args.indent,
                 clear_output=not args.no_clear,
                 quiet=args.quiet,
+                max_workers=args.jobs,
             )
             if not args.quiet:
                 print(
@@ -193,9 +215,14 @@ def parse_dir(
     indent: int = 2,
     clear_output: bool = True,
     quiet: bool = False,
+    max_workers: Optional[int] = None,
 ) -> Tuple[int, int]:
     """Parse all Excel files in a directory
 
+    Files are converted in parallel worker processes; results are reported
+    in directory order. If a worker process dies, e.g. killed for running
+    out of memory, the files not reported yet are counted as failed.
+
     Args:
         excel_dir: Directory containing Excel files
         json_dir: Output directory for JSON files
@@ -203,14 +230,19 @@ def parse_dir(
         indent: JSON indentation level
         clear_output: Clear output directory before processing
         quiet: Suppress non-error output
+        max_workers: Number of worker processes (default: CPU count)
 
     Returns:
         Tuple of (success_count, failure_count)
 
     Raises:
+        ValueError: If max_workers is less than 1
         FileNotFoundError: If excel_dir doesn't exist
         NotADirectoryError: If excel_dir is not a directory
     """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
     # Validate input directory
     if not os.path.exists(excel_dir):
         raise FileNotFoundError(f"Input directory not found: {excel_dir}")
@@ -223,32 +255,62 @@ def parse_dir(
 
     # Clear existing JSON files
     if clear_output:
-        for filename in os.listdir(json_dir):
-            file_path = os.path.join(json_dir, filename)
-            if os.path.isfile(file_path) and filename.endswith(".json"):
-                os.remove(file_path)
+        with os.scandir(json_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    os.remove(entry.path)
 
     # Process Excel files
     success_count = 0
     failure_count = 0
 
-    excel_files = list(glob.glob("*.xlsx", root_dir=excel_dir))
+    # Hidden files are skipped, as a "*.xlsx" glob would
+    with os.scandir(excel_dir) as entries:
+        excel_files = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith((".xlsx", ".xlsm"))
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
 
     if not excel_files:
         if not quiet:
             print(f"Warning: No Excel files found in {excel_dir}")
         return (0, 0)
 
-    for filename in excel_files:
-        if not quiet:
-            print(f"{filename}:\t", end="")
-        excel_file = os.path.join(excel_dir, filename)
-        json_file = os.path.join(json_dir, os.path.splitext(filename)[0] + ".json")
+    excel_paths = [os.path.join(excel_dir, filename) for filename in excel_files]
+    json_paths = [
+        os.path.join(json_dir, os.path.splitext(filename)[0] + ".json")
+        for filename in excel_files
+    ]
+    workers = min(len(excel_files), max_workers or os.cpu_count() or 1)
 
-        if parse_file(excel_file, json_file, verbose, indent, quiet):
-            success_count += 1
-        else:
-            failure_count += 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        convert = executor.map if executor else map
+        errors = convert(
+            convert_file, excel_paths, json_paths, repeat(verbose), repeat(indent)
+        )
+        for filename in excel_files:
+            try:
+                error = next(errors)
+            except BrokenProcessPool as e:
+                # No result comes back for this file or the ones after it
+                error = f"[ERROR] Worker process died: {e}"
+                errors = repeat(error)
+            if not quiet:
+                print(f"{filename}:\t", end="")
+            if error is None:
+                if not quiet:
+                    print("[OK] Success!")
+                success_count += 1
+            else:
+                print(error, file=sys.stderr)
+                failure_count += 1
+    finally:
+        if executor:
+            executor.shutdown()
 
     return (success_count, failure_count)
 
@@ -272,27 +334,58 @@ def parse_file(
     Returns:
         True if successful, False otherwise
     """
+    error = convert_file(excel_file, json_file, verbose, indent)
+    if error is not None:
+        print(error, file=sys.stderr)
+        return False
+
+    if not quiet:
+        print("[OK] Success!")
+    return True
+
+
+def convert_file(
+    excel_file: str,
+    json_file: str,
+    verbose: bool = False,
+    indent: int = 2,
+) -> Optional[str]:
+    """Convert a single Excel file to JSON without printing anything
+
+    Used by worker processes, so errors are returned as text instead of
+    being printed.
+
+    Args:
+        excel_file: Path to Excel file
+        json_file: Path to output JSON file
+        verbose: Include the traceback in the error report
+        indent: JSON indentation level
+
+    Returns:
+        None if successful, otherwise the error report
+    """
     try:
-        json_str = excel_parser.get_json(excel_file, indent=indent)
+        json_bytes = excel_parser.get_json_bytes(excel_file, indent=indent)
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(json_file) or ".", exist_ok=True)
 
-        with open(json_file, "w", encoding="utf-8") as file:
-            file.write(json_str)
+        with open(json_file, "wb") as file:
+            file.write(json_bytes)
 
-        if not quiet:
-            print("[OK] Success!")
-        return True
+        return None
     except TableError as e:
         # Handle our custom exceptions with detailed error messages
-        print(f"[ERROR] {e}", file=sys.stderr)
-        if verbose:
-            traceback.print_exc()
-        return False
+        return error_report(f"[ERROR] {e}", verbose)
     except Exception as e:
         # Handle unexpected errors
-        print(f"[ERROR] Unexpected error: {type(e).__name__}: {e}", file=sys.stderr)
-        if verbose:
-            traceback.print_exc()
-        return False
+        return error_report(
+            f"[ERROR] Unexpected error: {type(e).__name__}: {e}", verbose
+        )
+
+
+def error_report(message: str, verbose: bool) -> str:
+    """Append the traceback of the exception being handled if verbose"""
+    if verbose:
+        return f"{message}\n{traceback.format_exc().rstrip()}"
+    return message
@@ -1,9 +1,26 @@
 import openpyxl
-from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell import Cell
+from openpyxl.cell.read_only import ReadOnlyCell
+from openpyxl.cell.text import Text
+from openpyxl.utils import column_index_from_string
+from openpyxl.utils.datetime import from_excel, from_ISO8601
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import iterparse
+import copy
+import io
 import json
 import os
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Any, BinaryIO, Iterator, Optional
+from warnings import warn
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from . import head_type
 from .exceptions import (
@@ -14,29 +31,79 @@ from .exceptions import (
     MissingDataMarkerError,
 )
 
+SOURCE_CHUNK_SIZE = 1 << 20
+DATA_CACHE_SIZE = 32
+FILE_FORMATS = ("xlsx", "xlsm")
+SHARED_TEXT_MAX_LENGTH = 64
+ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+INLINE_STRING_TAG = f"{{{SHEET_MAIN_NS}}}is"
+TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+
+type file_source = str | bytes | bytearray | BinaryIO
+MERGE_CELL_RE = re.compile(rb"<(?:[\w.-]+:)?mergeCell\s[^>]*?\bref=[\"']([^\"']+)[\"']")
+
 
 class Head:
     def __init__(
-        self, sheet: Worksheet, row: tuple[Cell, ...], filename: Optional[str] = None
+        self,
+        merged_ranges: list[CellRange],
+        row: tuple[Cell, ...],
+        filename: Optional[str] = None,
     ) -> None:
-        self.sheet = sheet
-        self.column = len(row)
+        self.merged_ranges = merged_ranges
+        self.merged_rows: dict[int, dict[int, Optional[int]]] = {}
         self.filename = filename
         self.head = head_type.head_creator(row[0], filename)
-        self.headList: list[head_type.HeadType] = [self.head] * self.column
+        self.headList: list[head_type.HeadType] = [self.head] * len(row)
+
+    def merged_columns(self, row: int) -> dict[int, Optional[int]]:
+        """Index the merged ranges crossing a row by column
+
+        The top-left cell of a range maps to the last column it spans, the
+        other cells map to None since their values are hidden by the merge.
+        """
+        columns: dict[int, Optional[int]] = {}
+        for i in self.merged_ranges:
+            if i.min_row <= row <= i.max_row:
+                columns.update(dict.fromkeys(range(i.min_col, i.max_col + 1)))
+                if i.min_row == row:
+                    columns[i.min_col] = i.max_col
+        return columns
 
-    def get_cell_max_col(self, cell: Cell) -> int:
-        for i in self.sheet.merged_cells.ranges:
-            if cell.coordinate in i:
-                return i.max_col - 1
-        return cell.column - 1
+    def hidden_columns(self, min_row: int, width: int) -> dict[int, list[int]]:
+        """Index the cells hidden by merged ranges from ``min_row`` on by row
+
+        Only the top-left cell of a range holds its value, some writers keep
+        the values of the other cells anyway. They are listed as indexes
+        into data rows ``width`` columns wide, to be read as empty.
+        """
+        rows: dict[int, list[int]] = {}
+        for i in self.merged_ranges:
+            if i.max_row < min_row or i.min_col > width:
+                continue
+            for row in range(max(i.min_row, min_row), i.max_row + 1):
+                first = i.min_col + 1 if row == i.min_row else i.min_col
+                columns = range(first - 1, min(i.max_col, width))
+                rows.setdefault(row, []).extend(columns)
+        return rows
+
+    def get_cell_max_col(self, cell: Cell) -> Optional[int]:
+        if cell.row not in self.merged_rows:
+            self.merged_rows[cell.row] = self.merged_columns(cell.row)
+        max_col = self.merged_rows[cell.row].get(cell.column, cell.column)
+        return None if max_col is None else max_col - 1
 
     def row_parser(self, row: tuple[Cell, ...]) -> None:
+        # Header rows end at their last cell, columns past the widest row so
+        # far still belong to the root
+        if len(row) > len(self.headList):
+            self.headList += [self.head] * (len(row) - len(self.headList))
         i = 0
-        while i < self.column:
-            if row[i].value:
+        while i < len(row):
+            j = self.get_cell_max_col(row[i]) if row[i].value else None
+            if j is not None:
                 h = head_type.head_creator(row[i], self.filename)
-                j = self.get_cell_max_col(row[i])
                 self.headList[i].add_child(h)
                 self.headList[i:j] = [h] * (j - i)
                 i = j
@@ -44,7 +111,178 @@ class Head:
                 i += 1
 
 
-def get_data(filename: str) -> head_type.data:
+def _get_merged_ranges(sheet: ReadOnlyWorksheet) -> list[CellRange]:
+    """Read the merged cell ranges of a read-only worksheet
+
+    Read-only worksheets do not expose ``merged_cells``. The ``mergeCell``
+    elements follow the whole ``sheetData`` block, so the raw XML is scanned
+    in chunks instead of being parsed element by element.
+
+    Args:
+        sheet: Worksheet loaded with ``read_only=True``
+
+    Returns:
+        List of merged cell ranges
+    """
+    ranges = []
+    tail = b""
+    with sheet._get_source() as source:
+        while chunk := source.read(SOURCE_CHUNK_SIZE):
+            buffer = tail + chunk
+            # Only scan up to the last tag start, which may still be incomplete
+            end = buffer.rfind(b"<")
+            if end < 0:
+                end = len(buffer)
+            for match in MERGE_CELL_RE.finditer(buffer, 0, end):
+                ranges.append(CellRange(match.group(1).decode()))
+            tail = buffer[end:]
+    for match in MERGE_CELL_RE.finditer(tail):
+        ranges.append(CellRange(match.group(1).decode()))
+    return ranges
+
+
+def _iter_rows(
+    sheet: ReadOnlyWorksheet, min_row: int = 1, max_col: Optional[int] = None
+) -> Iterator[tuple[Any, ...]]:
+    """Read the values of a read-only worksheet row by row
+
+    A leaner ``sheet.iter_rows(min_row, max_col=max_col, values_only=True)``:
+    values are converted as openpyxl does for ``data_only`` workbooks, but
+    straight from the parsed row elements, without building a dict per cell.
+    Rows missing from the file are yielded empty. Rows are padded to
+    ``max_col`` when given, otherwise they end at their last cell: the
+    declared sheet dimension is not trusted, some writers leave it stale.
+    This relies on private openpyxl attributes, hence the upper bound on
+    openpyxl in pyproject.toml; tests/test_parsing.py checks it against
+    ``iter_rows``.
+
+    Args:
+        sheet: Worksheet loaded with ``read_only=True``
+        min_row: First row to yield
+        max_col: Number of columns to yield, all of them if None
+
+    Returns:
+        Iterator over tuples of cell values
+    """
+    workbook = sheet.parent
+    shared_strings = sheet._shared_strings
+    date_formats = workbook._date_formats
+    timedelta_formats = workbook._timedelta_formats
+    empty_row = (None,) * max_col if max_col else ()
+    column_indices: dict[str, int] = {}
+    shared_texts: dict[str, str] = {}
+
+    next_row = min_row
+    row_index = 0
+    with sheet._get_source() as source:
+        for _, element in iterparse(source):
+            if element.tag != ROW_TAG:
+                continue
+            attribute = element.get("r")
+            row_index = int(float(attribute)) if attribute else row_index + 1
+            if row_index < next_row:
+                element.clear()
+                continue
+
+            values = [None] * max_col if max_col else []
+            column = 0
+            for cell in element:
+                coordinate = cell.get("r")
+                if coordinate:
+                    letters = coordinate.rstrip("0123456789")
+                    column = column_indices.get(letters)
+                    if column is None:
+                        column = column_index_from_string(letters)
+                        column_indices[letters] = column
+                else:
+                    column += 1
+                if column > len(values):
+                    if max_col:
+                        continue
+                    values.extend([None] * (column - len(values)))
+
+                data_type = cell.get("t", "n")
+                if data_type == "inlineStr":
+                    text = cell.find(INLINE_STRING_TAG)
+                    if text is None:
+                        value = None
+                    elif len(text) == 1 and text[0].tag == TEXT_TAG:
+                        value = text[0].text or ""
+                        # Short inline strings tend to repeat, share one copy
+                        # per sheet read instead of one per cell
+                        if len(value) < SHARED_TEXT_MAX_LENGTH:
+                            value = shared_texts.setdefault(value, value)
+                    else:
+                        value = Text.from_tree(text).content
+                else:
+                    value = cell.findtext(VALUE_TAG) or None
+                    if value is None:
+                        pass
+                    elif data_type == "n":
+                        if "." in value or "E" in value or "e" in value:
+                            value = float(value)
+                        else:
+                            value = int(value)
+                        style_id = int(cell.get("s", 0)) if date_formats else 0
+                        if style_id in date_formats:
+                            try:
+                                value = from_excel(
+                                    value,
+                                    workbook.epoch,
+                                    timedelta=style_id in timedelta_formats,
+                                )
+                            except (OverflowError, ValueError):
+                                warn(
+                                    f"Cell {coordinate} is marked as a date but the "
+                                    f"serial value {value} is outside the limits for "
+                                    "dates. The cell will be treated as an error."
+                                )
+                                value = "#VALUE!"
+                    elif data_type == "s":
+                        value = shared_strings[int(value)]
+                    elif data_type == "b":
+                        value = bool(int(value))
+                    elif data_type == "d":
+                        value = from_ISO8601(value)
+                values[column - 1] = value
+            element.clear()
+
+            while next_row < row_index:
+                yield empty_row
+                next_row += 1
+            yield tuple(values)
+            next_row += 1
+
+
+def _header_cells(
+    sheet: ReadOnlyWorksheet, row: int, values: tuple[Any, ...]
+) -> tuple[ReadOnlyCell, ...]:
+    """Wrap the raw values of a header row into cells that know their coordinates"""
+    return tuple(
+        ReadOnlyCell(sheet, row, column, value)
+        for column, value in enumerate(values, start=1)
+    )
+
+
+def get_data(
+    filename: file_source, format: Optional[str] = None, cache: bool = False
+) -> head_type.data:
+    """Parse an Excel file into its data
+
+    Args:
+        filename: Path to Excel file, or its content as bytes or a binary file
+        format: Format of in-memory content, "xlsx" (default) or "xlsm";
+            files are checked by their extension
+        cache: Keep the parsed file until it is modified and reuse it on the
+            next cached call; each call still returns a copy the caller may
+            mutate. In-memory content is never cached.
+
+    Returns:
+        Data of the ``#data`` rows
+    """
+    if isinstance(filename, (bytes, bytearray, io.IOBase)):
+        return _read_buffer(filename, format)
+
     # Validate input
     if not filename:
         raise ValueError("Filename cannot be empty")
@@ -55,68 +293,171 @@ def get_data(filename: str) -> head_type.data:
     if not filename.lower().endswith((".xlsx", ".xlsm")):
         raise InvalidFileFormatError(filename)
 
+    if not cache:
+        return _read_workbook(filename, filename)
+
+    stat = os.stat(filename)
+    return copy.deepcopy(
+        _load_data(filename, os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@lru_cache(maxsize=DATA_CACHE_SIZE)
+def _load_data(filename: str, path: str, mtime_ns: int, size: int) -> head_type.data:
+    """Load and parse a workbook, cached on its absolute path, mtime and size
+
+    ``filename`` is kept as given for error messages. The result is shared
+    between calls: do not mutate it.
+    """
+    return _read_workbook(filename, filename)
+
+
+def _read_buffer(
+    buffer: bytes | bytearray | BinaryIO, format: Optional[str] = None
+) -> head_type.data:
+    """Parse in-memory Excel content, which is not cached"""
+    if (format or "xlsx").lower() not in FILE_FORMATS:
+        raise InvalidFileFormatError(None)
+
+    if isinstance(buffer, (bytes, bytearray)):
+        buffer = io.BytesIO(buffer)
+    return _read_workbook(buffer)
+
+
+def _read_workbook(
+    file: str | BinaryIO, filename: Optional[str] = None
+) -> head_type.data:
+    """Load a workbook and parse its active sheet
+
+    Args:
+        file: Path or binary file object of the workbook
+        filename: Optional filename for error reporting
+    """
     # Load workbook
     try:
-        workbook = openpyxl.load_workbook(filename)
+        # External links are never followed, so their cached parts are not read
+        workbook = openpyxl.load_workbook(
+            file, read_only=True, data_only=True, keep_links=False
+        )
     except Exception as e:
         raise InvalidFileFormatError(filename) from e
 
-    if not workbook.active:
+    try:
+        return _parse_sheet(workbook.active, filename)
+    finally:
+        workbook.close()
+
+
+def _parse_sheet(
+    sheet: Optional[ReadOnlyWorksheet], filename: Optional[str] = None
+) -> head_type.data:
+    if not sheet:
         raise EmptyFileError(filename)
 
-    iter_rows = workbook.active.iter_rows()
+    rows = _iter_rows(sheet)
+    iter_rows = enumerate(rows, start=1)
 
     # Check first row
     try:
-        first_row = next(iter_rows)
+        _, first_row = next(iter_rows)
     except StopIteration:
         raise EmptyFileError(filename)
 
-    # Validate #head marker
-    first_cell = first_row[0]
+    # Validate #head marker, the root header cell is B1 even if it is empty
+    first_row += (None,) * (2 - len(first_row))
+    first_cells = _header_cells(sheet, 1, first_row)
+    first_cell = first_cells[0]
     if first_cell.value != "#head":
         raise MissingHeaderMarkerError(
             first_cell, str(first_cell.value) if first_cell.value else "empty", filename
         )
 
     # Parse header
-    head = Head(workbook.active, first_row[1:], filename)
+    head = Head(_get_merged_ranges(sheet), first_cells[1:], filename)
 
-    # Parse rows
-    is_data = False
+    for data_start, row in iter_rows:
+        marker = row[0] if row else None
+        if marker == "#":
+            continue
+        elif marker == "#data":
+            break
+        head.row_parser(_header_cells(sheet, data_start, row)[1:])
+    else:
+        # Validate data was found
+        raise MissingDataMarkerError(filename)
+    rows.close()
+    head.head.freeze()
+
+    # Parse data rows, read only as wide as the columns the header uses
+    parse = head.head.parse_data
+    width = head.head.max_column() + 1
+    data_rows = _iter_rows(sheet, min_row=data_start, max_col=width)
+    hidden_columns = head.hidden_columns(data_start, width)
     data_root = None
 
-    for row in iter_rows:
-        if row[0].value == "#":
+    for row_index, row in enumerate(data_rows, start=data_start):
+        hidden = hidden_columns.get(row_index)
+        if hidden:
+            values = list(row)
+            for column in hidden:
+                values[column] = None
+            row = tuple(values)
+        if row[0] == "#":
             continue
-        elif row[0].value == "#data":
-            is_data = True
-            data_root = head.head.parse_data(row[1:], True, filename)
-            continue
-
-        if is_data:
-            head.head.parse_data(row[1:], False, filename)
+        elif row[0] == "#data":
+            data_root = parse(row, row_index, True, filename)
         else:
-            head.row_parser(row[1:])
-
-    # Validate data was found
-    if data_root is None:
-        raise MissingDataMarkerError(filename)
+            parse(row, row_index, False, filename)
 
     return data_root
 
 
-def get_json(filename: str, indent: int = 2) -> str:
+def get_json(
+    filename: file_source, indent: int = 2, format: Optional[str] = None
+) -> str:
     """Convert Excel file to JSON string
 
+    Always encoded with the json module, whether orjson is installed or not.
+
     Args:
-        filename: Path to Excel file
+        filename: Path to Excel file, or its content as bytes or a binary file
         indent: JSON indentation level (default 2)
+        format: Format of in-memory content, as for ``get_data``
 
     Returns:
         Formatted JSON string
     """
-    return json.dumps(get_data(filename), indent=indent)
+    return json.dumps(get_data(filename, format), indent=indent)
+
+
+def get_json_bytes(
+    filename: file_source, indent: int = 2, format: Optional[str] = None
+) -> bytes:
+    """Convert Excel file to UTF-8 encoded JSON, ready to be written to disk
+
+    orjson is used when installed and the indentation is 2, the only one it
+    supports; otherwise the standard json module is used. Non-ASCII text is
+    written as is in both cases. The output is not byte-identical between
+    the two: some floats are spelled differently (orjson writes ``0.00001``
+    and ``2.5e-7`` where json writes ``1e-05`` and ``2.5e-07``), though
+    they decode to the same values.
+
+    Args:
+        filename: Path to Excel file, or its content as bytes or a binary file
+        indent: JSON indentation level (default 2)
+        format: Format of in-memory content, as for ``get_data``
+
+    Returns:
+        Formatted JSON bytes
+    """
+    data = get_data(filename, format)
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the json module handles
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
 
 
 if __name__ == "__main__":
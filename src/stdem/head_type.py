@@ -1,5 +1,7 @@
 from openpyxl.cell import Cell
-from typing import Optional
+from openpyxl.cell.read_only import ReadOnlyCell
+from functools import lru_cache
+from typing import Any, Optional
 
 from .exceptions import (
     InvalidTypeNameError,
@@ -14,108 +16,128 @@ type data = int | float | str | dict[str, data] | list[data] | None
 
 
 class HeadType:
+    __slots__ = ("name", "cell", "column")
+
     def __init__(self, name: str, cell: Cell) -> None:
         self.name = name
         self.cell = cell
-        self.column = cell.column - 2
+        # Index into the data row tuple, which starts with the marker column
+        self.column = cell.column - 1
 
     def add_child(self, child: "HeadType"):
         raise ChildAdditionError(
             self.cell, self.__class__.__name__, "This type does not support children"
         )
 
+    def freeze(self) -> None:
+        """Mark the header tree as complete, no children are added afterwards"""
+
+    def data_cell(self, row: int, value: Any = None) -> ReadOnlyCell:
+        """Rebuild the cell of this column in a data row for error reporting
+
+        Data rows are read as plain value tuples, so cells are only created
+        on the error path.
+        """
+        return ReadOnlyCell(self.cell.parent, row, self.cell.column, value)
+
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
-        if enable:
-            if data[self.column].value is not None:
-                return data[self.column].value
-            else:
-                return None
-        elif data[self.column].value is not None:
-            raise UnexpectedDataError(data[self.column], filename)
-
-    def _validate_and_convert(
-        self, cell: Cell, enable: bool, filename: Optional[str] = None
-    ):
-        """Helper method to validate cell data and handle conversion
-
-        Args:
-            cell: The cell to validate
-            enable: Whether data is expected in this cell
-            filename: Optional filename for error reporting
-
-        Returns:
-            Tuple of (should_process, cell_value) where should_process indicates
-            if conversion should proceed and cell_value is the raw value
-
-        Raises:
-            UnexpectedDataError: If data found when enable=False
-        """
-        if enable:
-            if cell.value is not None:
-                return True, cell.value
-            else:
-                return False, None
-        else:
-            if cell.value is not None:
-                raise UnexpectedDataError(cell, filename)
-            return False, None
+        value = data[self.column]
+        if value is not None and not enable:
+            raise UnexpectedDataError(self.data_cell(row, value), filename)
+        return value
+
+    def max_column(self) -> int:
+        """Index of the last data row column read by this header tree"""
+        return self.column
 
     def __repr__(self) -> str:
         return self.name
 
 
 class HeadInt(HeadType):
+    __slots__ = ()
+
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
-        should_process, value = self._validate_and_convert(
-            data[self.column], enable, filename
-        )
-        if should_process:
-            try:
-                return int(value)
-            except (ValueError, TypeError) as e:
-                raise TypeConversionError(data[self.column], value, "int", e, filename)
-        return None
+        value = data[self.column]
+        if value is None:
+            return None
+        if not enable:
+            raise UnexpectedDataError(self.data_cell(row, value), filename)
+        if type(value) is int:
+            return value
+        try:
+            return int(value)
+        except (ValueError, TypeError) as e:
+            raise TypeConversionError(
+                self.data_cell(row, value), value, "int", e, filename
+            )
 
 
 class HeadString(HeadType):
+    __slots__ = ()
+
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
-        should_process, value = self._validate_and_convert(
-            data[self.column], enable, filename
-        )
-        if should_process:
-            try:
-                return str(value)
-            except Exception as e:
-                raise TypeConversionError(
-                    data[self.column], value, "string", e, filename
-                )
-        return None
+        value = data[self.column]
+        if value is None:
+            return None
+        if not enable:
+            raise UnexpectedDataError(self.data_cell(row, value), filename)
+        if type(value) is str:
+            return value
+        try:
+            return str(value)
+        except Exception as e:
+            raise TypeConversionError(
+                self.data_cell(row, value), value, "string", e, filename
+            )
 
 
 class HeadFloat(HeadType):
+    __slots__ = ()
+
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
-        should_process, value = self._validate_and_convert(
-            data[self.column], enable, filename
-        )
-        if should_process:
-            try:
-                return float(value)
-            except (ValueError, TypeError) as e:
-                raise TypeConversionError(
-                    data[self.column], value, "float", e, filename
-                )
-        return None
+        value = data[self.column]
+        if value is None:
+            return None
+        if not enable:
+            raise UnexpectedDataError(self.data_cell(row, value), filename)
+        if type(value) is float:
+            return value
+        try:
+            return float(value)
+        except (ValueError, TypeError) as e:
+            raise TypeConversionError(
+                self.data_cell(row, value), value, "float", e, filename
+            )
 
 
 class HeadList(HeadType):
+    __slots__ = ("key", "value", "data")
+
     def __init__(self, name: str, cell: Cell) -> None:
         super().__init__(name, cell)
         self.key: HeadInt = None
@@ -136,24 +158,36 @@ class HeadList(HeadType):
             )
 
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
         if enable:
             self.data = []
-        key = self.key.parse_data(data, True, filename)
-        if key is not None:
+        if data[self.key.column] is None:
+            self.value.parse_data(data, row, False, filename)
+        else:
+            key = self.key.parse_data(data, row, True, filename)
             if key != len(self.data):
                 raise InvalidIndexError(
-                    data[self.column], len(self.data), key, filename
+                    self.data_cell(row, key), len(self.data), key, filename
                 )
-            self.data.append(self.value.parse_data(data, True, filename))
-        else:
-            self.value.parse_data(data, False, filename)
+            self.data.append(self.value.parse_data(data, row, True, filename))
         if enable:
             return self.data
 
+    def max_column(self) -> int:
+        return max(self.key.max_column(), self.value.max_column())
+
+    def freeze(self) -> None:
+        self.value.freeze()
+
 
 class HeadDict(HeadType):
+    __slots__ = ("key", "value", "data")
+
     def __init__(self, name: str, cell: Cell) -> None:
         super().__init__(name, cell)
         self.key: HeadString = None
@@ -174,38 +208,61 @@ class HeadDict(HeadType):
             )
 
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
         if enable:
             self.data = {}
-        key = self.key.parse_data(data, True, filename)
-        if key is not None:
-            self.data[key] = self.value.parse_data(data, True, filename)
+        if data[self.key.column] is None:
+            self.value.parse_data(data, row, False, filename)
         else:
-            self.value.parse_data(data, False, filename)
+            key = self.key.parse_data(data, row, True, filename)
+            self.data[key] = self.value.parse_data(data, row, True, filename)
         if enable:
             return self.data
 
+    def max_column(self) -> int:
+        return max(self.key.max_column(), self.value.max_column())
+
+    def freeze(self) -> None:
+        self.value.freeze()
+
 
 class HeadClass(HeadType):
+    __slots__ = ("children",)
+
     def __init__(self, name: str, cell: Cell) -> None:
         super().__init__(name, cell)
-        self.children: list[HeadType] = []
+        self.children: list[HeadType] | tuple[HeadType, ...] = []
 
     def add_child(self, child: "HeadType"):
         self.children.append(child)
 
+    def freeze(self) -> None:
+        self.children = tuple(self.children)
+        for i in self.children:
+            i.freeze()
+
     def parse_data(
-        self, data: list[Cell], enable: bool, filename: Optional[str] = None
+        self,
+        data: tuple[Any, ...],
+        row: int,
+        enable: bool,
+        filename: Optional[str] = None,
     ) -> data:
         if enable:
-            ret = {}
-            for i in self.children:
-                ret[i.name] = i.parse_data(data, True, filename)
-            return ret
-        else:
-            for i in self.children:
-                i.parse_data(data, False, filename)
+            return {
+                i.name: i.parse_data(data, row, True, filename) for i in self.children
+            }
+        for i in self.children:
+            i.parse_data(data, row, False, filename)
+
+    def max_column(self) -> int:
+        # The marker column, read by every row, when the class is empty
+        return max((i.max_column() for i in self.children), default=0)
 
 
 TYPE_DICT: dict[str, type[HeadType]] = {
@@ -232,21 +289,34 @@ def head_creator(cell: Cell, filename: Optional[str] = None) -> HeadType:
         InvalidHeaderFormatError: If cell format is invalid
         InvalidTypeNameError: If type name is not recognized
     """
-    cell_value = str(cell.value) if cell.value else ""
+    value = cell.value
+    cell_value = value if type(value) is str else str(value) if value else ""
 
-    if ":" not in cell_value:
+    try:
+        name, head_class = _parse_header(cell_value)
+    except ValueError:
         raise InvalidHeaderFormatError(
             cell, f"Header must be in format 'name:type', got: '{cell_value}'", filename
-        )
+        ) from None
+    except KeyError as e:
+        raise InvalidTypeNameError(
+            cell, e.args[0], list(TYPE_DICT.keys()), filename
+        ) from None
 
-    try:
-        name, type_name = cell_value.split(":", 1)
-    except ValueError as e:
-        raise InvalidHeaderFormatError(
-            cell, f"Invalid header format: {str(e)}", filename
-        )
+    return head_class(name, cell)
+
+
+@lru_cache(maxsize=4096)
+def _parse_header(cell_value: str) -> tuple[str, type[HeadType]]:
+    """Split a "name:type" header into its name and header class
 
-    if type_name not in TYPE_DICT:
-        raise InvalidTypeNameError(cell, type_name, list(TYPE_DICT.keys()), filename)
+    Headers repeat across the files of a directory, so the result is cached.
 
-    return TYPE_DICT[type_name](name, cell)
+    Raises:
+        ValueError: If the separator is missing
+        KeyError: If the type name is not recognized, with the type name as argument
+    """
+    separator = cell_value.find(":")
+    if separator < 0:
+        raise ValueError(cell_value)
+    return cell_value[:separator], TYPE_DICT[cell_value[separator + 1 :]]
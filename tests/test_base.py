@@ -3,10 +3,19 @@ Base test utilities and fixtures
 """
 
 import unittest
+import io
+import json
 import os
-import openpyxl
 from pathlib import Path
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+from openpyxl import Workbook
+
+EXPECTED_NAMES = ("example", "UnitData", "SkillTable", "EffectTable")
+
 
 class BaseTestCase(unittest.TestCase):
     """Base test case with common utilities"""
@@ -29,7 +38,7 @@ class BaseTestCase(unittest.TestCase):
         Returns:
             Path to the created file
         """
-        wb = openpyxl.Workbook()
+        wb = Workbook()
         ws = wb.active
 
         if setup_func:
@@ -45,23 +54,46 @@ class BaseTestCase(unittest.TestCase):
             os.remove(filepath)
 
 
-class TemporaryExcelFile:
-    """Context manager for temporary Excel files"""
+class ExcelFixtureTestCase(BaseTestCase):
+    """Base test case building its Excel fixtures once per class
 
-    def __init__(self, filename: str, setup_func=None):
-        self.filename = Path("tests/excel") / filename
-        self.setup_func = setup_func
+    Subclasses list the fixtures as ``{name: rows}`` and their merged
+    ranges as ``{name: ranges}``; the workbooks are saved in memory and
+    their content is found in ``self.workbooks``.
+    """
 
-    def __enter__(self):
-        wb = openpyxl.Workbook()
-        ws = wb.active
+    fixtures: dict[str, list[list]] = {}
+    merges: dict[str, list[str]] = {}
 
-        if self.setup_func:
-            self.setup_func(wb, ws)
+    @classmethod
+    def setUpClass(cls):
+        """Build the fixture workbooks"""
+        super().setUpClass()
+        cls.workbooks = {}
+        for name, rows in cls.fixtures.items():
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            for cell_range in cls.merges.get(name, ()):
+                ws.merged_cells.add(cell_range)
+            for row in rows:
+                ws.append(row)
 
-        wb.save(str(self.filename))
-        return str(self.filename)
+            buffer = io.BytesIO()
+            wb.save(buffer)
+            cls.workbooks[name] = buffer.getvalue()
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+
+class ExpectedJSONTestCase(BaseTestCase):
+    """Test case with the expected JSON of each example file loaded once"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.expected = {}
+        for name in EXPECTED_NAMES:
+            with open(cls.test_json_dir / f"{name}.json", "rb") as f:
+                content = f.read()
+            if msgspec is not None:
+                cls.expected[name] = msgspec.json.decode(content)
+            else:
+                cls.expected[name] = json.loads(content)
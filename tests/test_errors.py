@@ -2,6 +2,8 @@
 Tests for error handling and validation
 """
 
+import os
+import tempfile
 import unittest
 from src import stdem
 from stdem.exceptions import (
@@ -11,8 +13,11 @@ from stdem.exceptions import (
     MissingDataMarkerError,
     InvalidTypeNameError,
     InvalidHeaderFormatError,
+    TypeConversionError,
+    UnexpectedDataError,
+    InvalidIndexError,
 )
-from tests.test_base import BaseTestCase, TemporaryExcelFile
+from tests.test_base import BaseTestCase, ExcelFixtureTestCase
 
 
 class TestFileErrors(BaseTestCase):
@@ -35,62 +40,148 @@ class TestFileErrors(BaseTestCase):
         with self.assertRaises(InvalidFileFormatError):
             stdem.ExcelParser.getData("tests/test_errors.py")
 
+    def test_invalid_buffer_format(self):
+        """Test that in-memory content of another format raises InvalidFileFormatError"""
+        with self.assertRaises(InvalidFileFormatError):
+            stdem.ExcelParser.getData(b"name,type", format="csv")
+
 
-class TestHeaderErrors(BaseTestCase):
+class TestHeaderErrors(ExcelFixtureTestCase):
     """Test header-related errors"""
 
+    fixtures = {
+        "no_head": [["invalid", "name:string"]],
+        "invalid_type": [["#head", "name:invalid_type"]],
+        "invalid_format": [["#head", "namestring"]],  # Missing colon
+    }
+
     def test_missing_head_marker(self):
         """Test that file without #head marker raises error"""
+        with self.assertRaises(MissingHeaderMarkerError) as context:
+            stdem.ExcelParser.getData(self.workbooks["no_head"], format="xlsx")
+        self.assertIn("#head", str(context.exception))
 
-        def setup(wb, ws):
-            ws["A1"] = "invalid"
-            ws["B1"] = "name:string"
+    def test_error_names_file(self):
+        """Test that errors from a file on disk start with its path"""
+        with tempfile.TemporaryDirectory() as directory:
+            test_file = os.path.join(directory, "test_no_head.xlsx")
+            with open(test_file, "wb") as f:
+                f.write(self.workbooks["no_head"])
 
-        with TemporaryExcelFile("test_no_head.xlsx", setup) as test_file:
             with self.assertRaises(MissingHeaderMarkerError) as context:
                 stdem.ExcelParser.getData(test_file)
-            self.assertIn("#head", str(context.exception))
+        self.assertTrue(str(context.exception).startswith(f"File: {test_file} |"))
 
     def test_invalid_type_name(self):
         """Test that invalid type name raises error"""
-
-        def setup(wb, ws):
-            ws["A1"] = "#head"
-            ws["B1"] = "name:invalid_type"
-
-        with TemporaryExcelFile("test_invalid_type.xlsx", setup) as test_file:
-            with self.assertRaises(InvalidTypeNameError) as context:
-                stdem.ExcelParser.getData(test_file)
-            self.assertIn("Invalid type", str(context.exception))
+        with self.assertRaises(InvalidTypeNameError) as context:
+            stdem.ExcelParser.getData(self.workbooks["invalid_type"], format="xlsx")
+        self.assertIn("Invalid type", str(context.exception))
 
     def test_invalid_header_format(self):
         """Test that header without colon raises error"""
+        with self.assertRaises(InvalidHeaderFormatError) as context:
+            stdem.ExcelParser.getData(self.workbooks["invalid_format"], format="xlsx")
+        self.assertIn("format", str(context.exception).lower())
 
-        def setup(wb, ws):
-            ws["A1"] = "#head"
-            ws["B1"] = "namestring"  # Missing colon
 
-        with TemporaryExcelFile("test_invalid_format.xlsx", setup) as test_file:
-            with self.assertRaises(InvalidHeaderFormatError) as context:
-                stdem.ExcelParser.getData(test_file)
-            self.assertIn("format", str(context.exception).lower())
-
-
-class TestDataErrors(BaseTestCase):
+class TestDataErrors(ExcelFixtureTestCase):
     """Test data-related errors"""
 
+    fixtures = {
+        "no_data": [["#head", "name:string"]],  # No #data row
+        "bad_int": [
+            ["#head", "root:class"],
+            [None, "a:int", "b:float"],
+            ["#data", "x", 1.5],
+        ],
+        "bad_float": [
+            ["#head", "root:class"],
+            [None, "a:int", "b:float"],
+            ["#data", 1, "y"],
+        ],
+        "disabled_cell": [
+            ["#head", "root:class"],
+            [None, "a:int", "b:float"],
+            ["#data", 1, 1.5],
+            [None, 2],  # Only lists and dicts take more rows
+        ],
+        "index_gap": [
+            ["#head", "items:list"],
+            [None, "index:int", "value:int"],
+            ["#data", 0, 5],
+            [None, 2, 6],  # Index 1 is missing
+        ],
+        "nested_index_gap": [
+            ["#head", "grid:list"],
+            [None, "row:int", "cells:list"],
+            [None, None, "col:int", "value:string"],
+            ["#data", 0, 0, "a"],
+            [None, None, 1, "b"],
+            [None, 1, 0, "c"],
+            [None, None, 1, "d"],
+            [None, None, 3, "e"],  # Index 2 is missing
+        ],
+        "merged_key": [
+            ["#head", "items:dict"],
+            [None, "key:string", "value:int"],
+            ["#data", "a", 1],
+            [None, "b", 2],
+            [None, "b", 3],  # Hidden by the merge, left by some writers
+        ],
+    }
+    merges = {
+        "bad_int": ["B1:C1"],
+        "bad_float": ["B1:C1"],
+        "disabled_cell": ["B1:C1"],
+        "index_gap": ["B1:C1"],
+        "nested_index_gap": ["B1:D1", "C2:D2"],
+        "merged_key": ["B1:C1", "B4:B5"],
+    }
+
     def test_missing_data_marker(self):
         """Test that file without #data marker raises error"""
-
-        def setup(wb, ws):
-            ws["A1"] = "#head"
-            ws["B1"] = "name:string"
-            # No #data row
-
-        with TemporaryExcelFile("test_no_data.xlsx", setup) as test_file:
-            with self.assertRaises(MissingDataMarkerError) as context:
-                stdem.ExcelParser.getData(test_file)
-            self.assertIn("#data", str(context.exception))
+        with self.assertRaises(MissingDataMarkerError) as context:
+            stdem.ExcelParser.getData(self.workbooks["no_data"], format="xlsx")
+        self.assertIn("#data", str(context.exception))
+
+    def test_invalid_int(self):
+        """Test that a value that is not an int raises TypeConversionError"""
+        with self.assertRaises(TypeConversionError) as context:
+            stdem.ExcelParser.getData(self.workbooks["bad_int"], format="xlsx")
+        self.assertEqual(context.exception.cell.coordinate, "B3")
+        self.assertIn("int", str(context.exception))
+
+    def test_invalid_float(self):
+        """Test that a value that is not a float raises TypeConversionError"""
+        with self.assertRaises(TypeConversionError) as context:
+            stdem.ExcelParser.getData(self.workbooks["bad_float"], format="xlsx")
+        self.assertEqual(context.exception.cell.coordinate, "C3")
+        self.assertIn("float", str(context.exception))
+
+    def test_data_in_disabled_cell(self):
+        """Test that data outside of a list or dict row raises UnexpectedDataError"""
+        with self.assertRaises(UnexpectedDataError) as context:
+            stdem.ExcelParser.getData(self.workbooks["disabled_cell"], format="xlsx")
+        self.assertEqual(context.exception.cell.coordinate, "B4")
+
+    def test_list_index_gap(self):
+        """Test that a skipped list index raises InvalidIndexError"""
+        with self.assertRaises(InvalidIndexError) as context:
+            stdem.ExcelParser.getData(self.workbooks["index_gap"], format="xlsx")
+        self.assertEqual(context.exception.cell.coordinate, "B4")
+
+    def test_nested_list_index_gap(self):
+        """Test that inner list indexes carry over the rows of an outer item"""
+        with self.assertRaises(InvalidIndexError) as context:
+            stdem.ExcelParser.getData(self.workbooks["nested_index_gap"], format="xlsx")
+        self.assertEqual(context.exception.cell.coordinate, "C8")
+
+    def test_merged_data_cells(self):
+        """Test that cells hidden by a merge are read as empty in data rows"""
+        with self.assertRaises(UnexpectedDataError) as context:
+            stdem.ExcelParser.getData(self.workbooks["merged_key"], format="xlsx")
+        self.assertEqual(context.exception.cell.coordinate, "C5")
 
 
 if __name__ == "__main__":
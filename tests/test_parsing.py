@@ -3,52 +3,188 @@ Tests for basic Excel parsing functionality
 """
 
 import unittest
+import io
 import json
+import re
+import zipfile
+from datetime import date, datetime, time, timedelta
+from openpyxl import load_workbook
 from src import stdem
-from tests.test_base import BaseTestCase
+from tests.test_base import EXPECTED_NAMES, ExcelFixtureTestCase, ExpectedJSONTestCase
 
 
-class TestBasicParsing(BaseTestCase):
+def rewrite_sheets(file, rewrite):
+    """Copy a workbook with ``rewrite`` applied to the XML of its sheets"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(file) as source, zipfile.ZipFile(buffer, "w") as target:
+        for item in source.infolist():
+            content = source.read(item)
+            if item.filename.startswith("xl/worksheets/"):
+                content = rewrite(content)
+            target.writestr(item, content)
+    return buffer.getvalue()
+
+
+def with_dimension(path, ref):
+    """Copy a workbook with the dimension of its sheets set to ``ref``"""
+    return rewrite_sheets(
+        path,
+        lambda content: re.sub(
+            rb'<dimension ref="[^"]*"', f'<dimension ref="{ref}"'.encode(), content
+        ),
+    )
+
+
+class TestBasicParsing(ExpectedJSONTestCase):
     """Test basic parsing of Excel files"""
 
-    def test_example_excel(self):
-        """Test parsing example.xlsx and compare with expected JSON"""
-        result = stdem.ExcelParser.getData("tests/excel/example.xlsx")
+    @classmethod
+    def setUpClass(cls):
+        """Parse the example files once, each subtest checks one result"""
+        super().setUpClass()
+        cls.results = {
+            name: stdem.ExcelParser.getData(f"tests/excel/{name}.xlsx")
+            for name in EXPECTED_NAMES
+        }
+
+    def test_example_files(self):
+        """Test parsing each example file and compare with expected JSON"""
+        for name in EXPECTED_NAMES:
+            with self.subTest(name=name):
+                self.assertEqual(self.results[name], self.expected[name])
+
+    def test_parse_from_bytes(self):
+        """Test parsing example.xlsx content held in memory"""
+        with open(self.test_excel_dir / "example.xlsx", "rb") as f:
+            result = stdem.ExcelParser.getData(f.read(), format="xlsx")
+
+        self.assertEqual(result, self.expected["example"])
+
+    def test_stale_dimension(self):
+        """Test that rows are read in full when the declared dimension is stale"""
+        for ref in ("A1", "A1:E5"):
+            with self.subTest(ref=ref):
+                content = with_dimension(self.test_excel_dir / "UnitData.xlsx", ref)
+                result = stdem.ExcelParser.getData(content, format="xlsx")
+                self.assertEqual(result, self.expected["UnitData"])
+
+    def test_repeated_reads_return_copies(self):
+        """Test that cached results are not shared between getData calls"""
+        first = stdem.ExcelParser.getData("tests/excel/example.xlsx", cache=True)
+        first.clear()
+
+        second = stdem.ExcelParser.getData("tests/excel/example.xlsx", cache=True)
+        self.assertEqual(second, self.expected["example"])
+
+
+class TestNestedLists(ExcelFixtureTestCase):
+    """Test lists whose items span several rows"""
 
-        with open("tests/json/example.json", "r", encoding="utf-8") as f:
-            expected = json.load(f)
+    fixtures = {
+        "grid": [
+            ["#head", "grid:list"],
+            [None, "row:int", "cells:list"],
+            [None, None, "col:int", "value:string"],
+            ["#data", 0, 0, "a"],
+            [None, None, 1, "b"],
+            [None, 1, 0, "c"],
+            [None, None, 1, "d"],
+            [None, None, 2, "e"],
+        ],
+    }
+    merges = {"grid": ["B1:D1", "C2:D2"]}
 
-        self.assertEqual(result, expected)
+    def test_list_of_lists(self):
+        """Test that inner lists keep growing across the rows of an outer item"""
+        result = stdem.ExcelParser.getData(self.workbooks["grid"], format="xlsx")
+        self.assertEqual(result, [["a", "b"], ["c", "d", "e"]])
 
-    def test_unit_data_excel(self):
-        """Test parsing UnitData.xlsx and compare with expected JSON"""
-        result = stdem.ExcelParser.getData("tests/excel/UnitData.xlsx")
 
-        with open("tests/json/UnitData.json", "r", encoding="utf-8") as f:
-            expected = json.load(f)
+def strip_coordinates(content):
+    """Drop empty rows, the coordinates of row 5 and its cells, and of row 6 cells"""
 
-        self.assertEqual(result, expected)
+    def rewrite_row(match):
+        row = match.group(0)
+        if match.group(1) == b"5":
+            return re.sub(rb' r="[^"]*"', b"", row)
+        if match.group(1) == b"6":
+            return re.sub(rb'(<c[^>]*?) r="[^"]*"', rb"\1", row)
+        return row
 
-    def test_skill_table_excel(self):
-        """Test parsing SkillTable.xlsx and compare with expected JSON"""
-        result = stdem.ExcelParser.getData("tests/excel/SkillTable.xlsx")
+    content = re.sub(rb'<row r="\d+"></row>', b"", content)
+    return re.sub(rb'<row r="(\d+)".*?</row>', rewrite_row, content, flags=re.S)
 
-        with open("tests/json/SkillTable.json", "r", encoding="utf-8") as f:
-            expected = json.load(f)
 
-        self.assertEqual(result, expected)
+class TestSheetReader(ExcelFixtureTestCase):
+    """Test that the sheet reader reads the values openpyxl reads"""
 
-    def test_effect_table_excel(self):
-        """Test parsing EffectTable.xlsx and compare with expected JSON"""
-        result = stdem.ExcelParser.getData("tests/excel/EffectTable.xlsx")
+    fixtures = {
+        "values": [
+            ["#head", datetime(2024, 5, 6, 7, 8, 9), True, 1.5, "=1+2", time(3, 4)],
+            [],  # Dropped from the file
+            ["text", 10**12, -3e-5, False, date(2020, 1, 1), timedelta(hours=30)],
+            ["注释 ✓", None, "x" * 100, 0, 2.5e-7],
+            ["no", "coordinates", 1, None, 2.0],
+            [None, "cells", "without", "coordinates"],
+            ["text", "text"],
+        ],
+    }
 
-        with open("tests/json/EffectTable.json", "r", encoding="utf-8") as f:
-            expected = json.load(f)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.content = rewrite_sheets(
+            io.BytesIO(cls.workbooks["values"]), strip_coordinates
+        )
 
-        self.assertEqual(result, expected)
+    def load(self, content):
+        """Load the first sheet of a workbook the way the parser does"""
+        workbook = load_workbook(
+            io.BytesIO(content), read_only=True, data_only=True, keep_links=False
+        )
+        self.addCleanup(workbook.close)
+        return workbook.worksheets[0]
 
+    def assert_same_rows(self, content, width):
+        """Compare the reader with openpyxl over a few row and column ranges"""
+        sheet = self.load(content)
+        for min_row, max_col in ((1, width), (3, width), (2, 3)):
+            with self.subTest(min_row=min_row, max_col=max_col):
+                expected = sheet.iter_rows(
+                    min_row=min_row, max_col=max_col, values_only=True
+                )
+                rows = stdem.excel_parser._iter_rows(sheet, min_row, max_col)
+                self.assertEqual(list(rows), list(expected))
 
-class TestJSONFormatting(BaseTestCase):
+    def test_values_match_openpyxl(self):
+        """Test dates, times, booleans, formulas, row gaps and inline strings"""
+        self.assert_same_rows(self.content, 6)
+
+        sheet = self.load(self.content)
+        rows = list(sheet.iter_rows(max_col=6, values_only=True))
+        self.assertEqual(rows[0][1], datetime(2024, 5, 6, 7, 8, 9))
+        self.assertEqual(rows[1], (None,) * 6)
+        self.assertEqual(rows[2][5], timedelta(hours=30))
+        # Cells without coordinates follow the previous cell
+        self.assertEqual(rows[4][:4], ("no", "coordinates", 1, 2))
+        self.assertEqual(rows[5][:3], ("cells", "without", "coordinates"))
+
+    def test_example_files_match_openpyxl(self):
+        """Test the example files, whose strings are shared"""
+        for name in EXPECTED_NAMES:
+            with open(self.test_excel_dir / f"{name}.xlsx", "rb") as f:
+                content = f.read()
+            sheet = self.load(content)
+            with self.subTest(name=name):
+                self.assert_same_rows(content, sheet.max_column)
+
+    def test_rows_end_at_last_cell(self):
+        """Test that rows are not padded without max_col"""
+        rows = list(stdem.excel_parser._iter_rows(self.load(self.content)))
+        self.assertEqual([len(row) for row in rows], [6, 0, 6, 5, 4, 3, 2])
+
+
+class TestJSONFormatting(ExpectedJSONTestCase):
     """Test JSON output formatting"""
 
     def test_get_json_returns_formatted_json(self):
@@ -63,9 +199,7 @@ class TestJSONFormatting(BaseTestCase):
         self.assertIn("\n", json_str)
 
         # Compare with expected
-        with open("tests/json/example.json", "r", encoding="utf-8") as f:
-            expected = json.load(f)
-        self.assertEqual(parsed, expected)
+        self.assertEqual(parsed, self.expected["example"])
 
     def test_custom_indentation(self):
         """Test getJson with custom indentation"""
@@ -88,6 +222,38 @@ class TestJSONFormatting(BaseTestCase):
         self.assertEqual(data_2, data_4)
         self.assertEqual(data_2, data_0)
 
+    def test_get_json_bytes(self):
+        """Test that get_json_bytes returns UTF-8 JSON with the same data"""
+        json_bytes = stdem.excel_parser.get_json_bytes("tests/excel/example.xlsx")
+        self.assertIsInstance(json_bytes, bytes)
+        self.assertIn(b"\n", json_bytes)
+
+        self.assertEqual(
+            json.loads(json_bytes.decode("utf-8")), self.expected["example"]
+        )
+
+
+class TestJSONEncoding(ExcelFixtureTestCase):
+    """Test that getJson output does not depend on orjson being installed"""
+
+    fixtures = {
+        "values": [
+            ["#head", "values:class"],
+            [None, "name:string", "small:float"],
+            ["#data", "注释", 0.00001],
+        ],
+    }
+    merges = {"values": ["B1:C1"]}
+
+    def test_get_json_uses_json_module(self):
+        """Test that floats and non-ASCII text are encoded as json.dumps does"""
+        content = self.workbooks["values"]
+        data = stdem.ExcelParser.getData(content, format="xlsx")
+        for indent in (2, 4):
+            with self.subTest(indent=indent):
+                json_str = stdem.ExcelParser.getJson(content, indent, format="xlsx")
+                self.assertEqual(json_str, json.dumps(data, indent=indent))
+
 
 if __name__ == "__main__":
     unittest.main()